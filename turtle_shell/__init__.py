@@ -1,3 +1,4 @@
+import functools
 from dataclasses import dataclass
 
 from django.views.generic import TemplateView
@@ -28,6 +29,7 @@ class _Registry:
         if not func_obj:
             func_obj = _Function.from_function(func, name=name, config=config)
             self.func_name2func[func_obj.name] = func_obj
+            _resolve_func.cache_clear()
         else:
             if func_obj.func is not func:
                 raise ValueError(f"Func {name} already registered. (existing is {func_obj})")
@@ -79,6 +81,7 @@ class _Registry:
     def clear(self):
         self.func_name2func.clear()
         self._schema = None
+        _resolve_func.cache_clear()
         assert not self.func_name2func
 
     @property
@@ -94,4 +97,14 @@ class _Registry:
 _RegistrySingleton = _Registry()
 get_registry = _Registry.get_registry
 
+
+@functools.lru_cache(maxsize=None)
+def _resolve_func(func_name):
+    """Look up the registered callable for func_name (cached until the registry changes)."""
+    func_obj = get_registry().get(func_name)
+    if not func_obj:
+        raise ValueError(f"No registered function defined for {func_name}")
+    return func_obj.func
+
+
 from .function_to_form import Text
@@ -9,6 +9,7 @@ representation to the user (and generally numbers aren't that valuable)
 """
 import enum
 import inspect
+import logging
 import re
 import typing
 
@@ -22,6 +23,8 @@ import pathlib
 
 from . import utils
 
+logger = logging.getLogger(__name__)
+
 
 class Text(str):
     """Wrapper class to be able to handle str types"""
@@ -144,9 +147,7 @@ class Coercer:
             resp = self._call(value)
             return resp
         except Exception as e:
-            import traceback
-
-            traceback.print_exc()
+            logger.debug("Could not coerce %r to %s", value, self.enum_type, exc_info=True)
             raise
 
     def _call(self, value):
@@ -158,9 +159,7 @@ class Coercer:
             resp = self.enum_type(value)
             return resp
         except ValueError as e:
-            import traceback
-
-            traceback.print_exc()
+            logger.debug("Could not coerce %r to %s by value", value, self.enum_type, exc_info=True)
             try:
                 return self.enum_type(int(value))
             except ValueError as f:
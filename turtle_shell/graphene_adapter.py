@@ -1,4 +1,5 @@
 import json
+import logging
 import graphene
 from graphene_django.forms.mutation import DjangoFormMutation
 from graphene_django import DjangoObjectType
@@ -16,6 +17,8 @@ import turtle_shell.graphene_adapter_jsonstring
 from turtle_shell import pydantic_adapter
 
 
+logger = logging.getLogger(__name__)
+
 _seen_names: set = set()
 
 # class FakeJSONModule:
@@ -92,20 +95,18 @@ def func_to_graphene_form_mutation(func_object):
         input = {**defaults, **input}
         form = cls.get_form(root, info, **input)
         if not form.is_valid():
-            print("FORM ERRORS", form.errors)
+            logger.debug("Form errors for %s: %s", form_class.__name__, form.errors)
         try:
             return super(DefaultOperationMutation, cls).mutate_and_get_payload(root, info, **input)
         except Exception as e:
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Failed to run mutation %s", cls.__name__)
             raise
 
     @classmethod
     def perform_mutate(cls, form, info):
         obj = form.save()
+        # execute() persists its own outcome
         all_results = obj.execute()
-        obj.save()
         kwargs = {"execution": obj}
         if hasattr(all_results, "dict"):
             for k, f in fields.items():
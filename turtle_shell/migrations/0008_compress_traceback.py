@@ -0,0 +1,58 @@
+import zlib
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def _convert_in_batches(queryset, source, target, convert):
+    """Stream rows and write target = convert(source) back in bulk, BATCH_SIZE at a time."""
+    batch = []
+    for execution in queryset.only("uuid", source).iterator(chunk_size=BATCH_SIZE):
+        setattr(execution, target, convert(getattr(execution, source)))
+        batch.append(execution)
+        if len(batch) >= BATCH_SIZE:
+            queryset.model.objects.bulk_update(batch, [target], batch_size=BATCH_SIZE)
+            batch = []
+    if batch:
+        queryset.model.objects.bulk_update(batch, [target], batch_size=BATCH_SIZE)
+
+
+def compress_tracebacks(apps, schema_editor):
+    ExecutionResult = apps.get_model("turtle_shell", "ExecutionResult")
+    _convert_in_batches(
+        ExecutionResult.objects.exclude(traceback=""),
+        "traceback",
+        "compressed_traceback",
+        lambda tb: zlib.compress(tb.encode("utf-8"), 1),
+    )
+
+
+def decompress_tracebacks(apps, schema_editor):
+    ExecutionResult = apps.get_model("turtle_shell", "ExecutionResult")
+    _convert_in_batches(
+        ExecutionResult.objects.exclude(compressed_traceback=None),
+        "compressed_traceback",
+        "traceback",
+        lambda compressed: zlib.decompress(compressed).decode("utf-8"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("turtle_shell", "0007_auto_20210413_0626"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="executionresult",
+            name="compressed_traceback",
+            field=models.BinaryField(editable=False, null=True),
+        ),
+        migrations.RunPython(compress_tracebacks, decompress_tracebacks),
+        migrations.RemoveField(
+            model_name="executionresult",
+            name="traceback",
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-14 13:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("turtle_shell", "0008_compress_traceback"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="executionresult",
+            index=models.Index(fields=["func_name", "-created"], name="exec_func_created_idx"),
+        ),
+    ]
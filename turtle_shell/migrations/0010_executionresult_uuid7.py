@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-14 13:37
+
+from django.db import migrations, models
+import turtle_shell.utils
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("turtle_shell", "0009_executionresult_func_created_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="executionresult",
+            name="uuid",
+            field=models.UUIDField(
+                default=turtle_shell.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+    ]
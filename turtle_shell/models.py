@@ -2,12 +2,38 @@ from django.db import models, transaction
 from django.urls import reverse
 from django.conf import settings
 from turtle_shell import utils
-import uuid
+from turtle_shell import _resolve_func
+import functools
 import json
 import logging
+import operator
+import traceback
+import zlib
 
 logger = logging.getLogger(__name__)
 
+# innermost stack entries kept (per chained exception) when storing a failed execution's traceback
+TRACEBACK_LIMIT = 20
+
+
+def _make_error_details(ex) -> dict:
+    """JSON-friendly summary of an exception for ``error_json``."""
+    return {"type": type(ex).__name__, "message": str(ex)}
+
+
+def _to_json_data(result):
+    """Convert a function result into something the output JSONField can store."""
+    if isinstance(result, (dict, list)):
+        # the common case - the field encoder handles it as-is
+        return result
+    if hasattr(result, "model_dump"):
+        # pydantic v2 can produce JSON-safe data directly
+        return result.model_dump(mode="json")
+    if hasattr(result, "json"):
+        # .dict() on pydantic v1 keeps enums/datetimes as objects, so round-trip instead
+        return json.loads(result.json())
+    return result
+
 
 class CaughtException(Exception):
     """An exception that was caught and saved. Generally don't need to rollback transaction with
@@ -29,7 +55,8 @@ class ExecutionResult(models.Model):
         ("user", "User"),
         ("status", "Status"),
     ]
-    uuid = models.UUIDField(primary_key=True, unique=True, editable=False, default=uuid.uuid4)
+    _list_entry_getter = operator.attrgetter(*(name for name, _ in FIELDS_TO_SHOW_IN_LIST))
+    uuid = models.UUIDField(primary_key=True, unique=True, editable=False, default=utils.uuid7)
     func_name = models.CharField(max_length=512, editable=False)
     input_json = models.JSONField(encoder=utils.EnumAwareEncoder, decoder=utils.EnumAwareDecoder)
     output_json = models.JSONField(
@@ -38,7 +65,8 @@ class ExecutionResult(models.Model):
     error_json = models.JSONField(
         default=dict, null=True, encoder=utils.EnumAwareEncoder, decoder=utils.EnumAwareDecoder
     )
-    traceback = models.TextField(default="")
+    # tracebacks are large and highly repetitive, so store them zlib-compressed (see .traceback)
+    compressed_traceback = models.BinaryField(null=True, editable=False)
 
     class ExecutionStatus(models.TextChoices):
         CREATED = "CREATED", "Created"
@@ -47,19 +75,27 @@ class ExecutionResult(models.Model):
         ERRORED = "ERRORED", "Errored"
         JSON_ERROR = "JSON_ERROR", "Result could not be coerced to JSON"
 
+    RUNNABLE_STATUSES = frozenset([ExecutionStatus.CREATED, ExecutionStatus.RUNNING])
+
     status = models.CharField(
-        max_length=10, choices=ExecutionStatus.choices, default=ExecutionStatus.CREATED
+        max_length=10,
+        choices=ExecutionStatus.choices,
+        default=ExecutionStatus.CREATED,
     )
 
     created = models.DateTimeField(auto_now_add=True)
     modified = models.DateTimeField(auto_now=True)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, null=True)
 
+    class Meta:
+        indexes = [
+            # per-function list view: filter(func_name=...).order_by("-created")
+            models.Index(fields=["func_name", "-created"], name="exec_func_created_idx"),
+        ]
+
     def execute(self):
         """Execute with given input, returning caught exceptions as necessary"""
-        from turtle_shell import pydantic_adapter
-
-        if self.status not in (self.ExecutionStatus.CREATED, self.ExecutionStatus.RUNNING):
+        if self.status not in self.RUNNABLE_STATUSES:
             raise ValueError("Cannot run - execution state isn't complete")
         func = self.get_function()
         original_result = None
@@ -67,48 +103,59 @@ class ExecutionResult(models.Model):
             # TODO: redo conversion another time!
             result = original_result = func(**self.input_json)
         except Exception as e:
-            import traceback
-
             logger.error(
-                f"Failed to execute {self.func_name} :(: {type(e).__name__}:{e}", exc_info=True
+                "Failed to execute %s :(: %s:%s", self.func_name, type(e).__name__, e, exc_info=True
             )
             # TODO: catch integrity error separately
-            self.error_json = {"type": type(e).__name__, "message": str(e)}
-            self.traceback = "".join(traceback.format_exc())
+            self.error_json = _make_error_details(e)
+            self.traceback = traceback.format_exc(limit=-TRACEBACK_LIMIT)
             self.status = self.ExecutionStatus.ERRORED
-            self.save()
+            self._save_fields("error_json", "compressed_traceback", "status")
             raise CaughtException(f"Failed on {self.func_name} ({type(e).__name__})", e) from e
         try:
-            if hasattr(result, "json"):
-                result = json.loads(result.json())
+            result = _to_json_data(result)
             # if not isinstance(result, (dict, str, tuple)):
             #     result = cattr.unstructure(result)
             self.output_json = result
             self.status = self.ExecutionStatus.DONE
-            # allow ourselves to save again externally
+            # keep this savepoint: save() wraps its query in mark_for_rollback_on_error(), so the
+            # TypeError from unserializable output would otherwise flag the caller's transaction
+            # as needs_rollback and break the fallback save below
             with transaction.atomic():
-                self.save()
+                self._save_fields("output_json", "status")
         except TypeError as e:
-            self.error_json = {"type": type(e).__name__, "message": str(e)}
+            self.error_json = _make_error_details(e)
             msg = f"Failed on {self.func_name} ({type(e).__name__})"
             if "JSON serializable" in str(e):
                 self.status = self.ExecutionStatus.JSON_ERROR
                 # save it as a str so we can at least have something to show
                 self.output_json = str(result)
-                self.save()
+                self._save_fields("output_json", "error_json", "status")
                 raise ResultJSONEncodeException(msg, e) from e
             else:
                 raise e
         return original_result
 
-    def get_function(self):
-        # TODO: figure this out
-        from . import get_registry
+    def _save_fields(self, *fields):
+        """Write only the given columns (plus modified) once the row exists.
+
+        Avoids re-encoding the (potentially large) JSON columns that didn't change."""
+        if self._state.adding:
+            self.save()
+        else:
+            self.save(update_fields=[*fields, "modified"])
+
+    def save(self, *args, **kwargs):
+        # pydantic_object is derived from output_json
+        self.__dict__.pop("pydantic_object", None)
+        super().save(*args, **kwargs)
 
-        func_obj = get_registry().get(self.func_name)
-        if not func_obj:
-            raise ValueError(f"No registered function defined for {self.func_name}")
-        return func_obj.func
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop("pydantic_object", None)
+        super().refresh_from_db(*args, **kwargs)
+
+    def get_function(self):
+        return _resolve_func(self.func_name)
 
     def get_absolute_url(self):
         # TODO: prob better way to do this so that it all redirects right :(
@@ -118,6 +165,17 @@ class ExecutionResult(models.Model):
         return f"<{type(self).__name__}({self})"
 
     @property
+    def traceback(self) -> str:
+        if not self.compressed_traceback:
+            return ""
+        return zlib.decompress(self.compressed_traceback).decode("utf-8")
+
+    @traceback.setter
+    def traceback(self, value: str):
+        # level 1 is nearly free and still shrinks traceback text several times over
+        self.compressed_traceback = zlib.compress(value.encode("utf-8"), 1) if value else None
+
+    @functools.cached_property
     def pydantic_object(self):
         from turtle_shell import pydantic_adapter
 
@@ -125,4 +183,4 @@ class ExecutionResult(models.Model):
 
     @property
     def list_entry(self) -> list:
-        return [getattr(self, obj_name) for obj_name, _ in self.FIELDS_TO_SHOW_IN_LIST]
+        return list(self._list_entry_getter(self))
@@ -0,0 +1,147 @@
+import pytest
+
+from turtle_shell.models import CaughtException, ExecutionResult, ResultJSONEncodeException
+from turtle_shell.models import TRACEBACK_LIMIT
+from .utils import create_execution, register_only
+
+
+def test_get_function_follows_registry():
+    def myfunc(a: str):
+        return a
+
+    def otherfunc(a: str):
+        return a + a
+
+    registry = register_only(myfunc)
+    execution = ExecutionResult(func_name="myfunc", input_json={"a": "x"})
+    assert execution.get_function() is myfunc
+    registry.clear()
+    with pytest.raises(ValueError, match="No registered function"):
+        execution.get_function()
+    registry.add(otherfunc, name="myfunc")
+    assert execution.get_function() is otherfunc
+
+
+def test_execute_only_writes_changed_columns(db):
+    def myfunc(a: str):
+        return {"doubled": a + a}
+
+    execution = create_execution(myfunc, a="x")
+    # unsaved in-memory change to a column execute() doesn't own
+    execution.input_json = {"a": "changed"}
+    execution.execute()
+    execution.refresh_from_db()
+    assert execution.status == ExecutionResult.ExecutionStatus.DONE
+    assert execution.output_json == {"doubled": "changed" * 2}
+    assert execution.input_json == {"a": "x"}
+
+
+def test_execute_unsaved(db):
+    def myfunc(a: str):
+        return a
+
+    register_only(myfunc)
+    execution = ExecutionResult(func_name="myfunc", input_json={"a": "x"})
+    execution.execute()
+    assert ExecutionResult.objects.get(pk=execution.pk).output_json == "x"
+
+
+def test_execute_unserializable_output(db):
+    def myfunc(a: str):
+        return {"obj": object()}
+
+    execution = create_execution(myfunc, a="x")
+    with pytest.raises(ResultJSONEncodeException):
+        execution.execute()
+    execution.refresh_from_db()
+    assert execution.status == ExecutionResult.ExecutionStatus.JSON_ERROR
+    assert execution.error_json["type"] == "TypeError"
+    assert "object object" in execution.output_json
+
+
+def test_execute_uses_model_dump(db):
+    class V2Like:
+        def model_dump(self, mode="python"):
+            assert mode == "json"
+            return {"value": 1}
+
+        def json(self):
+            raise AssertionError("should not need to round-trip through a JSON string")
+
+    def myfunc(a: str):
+        return V2Like()
+
+    execution = create_execution(myfunc, a="x")
+    execution.execute()
+    execution.refresh_from_db()
+    assert execution.output_json == {"value": 1}
+
+
+def test_execute_error_records_traceback(db, caplog):
+    def myfunc(a: str):
+        raise RuntimeError(f"bad {a}")
+
+    execution = create_execution(myfunc, a="x")
+    with pytest.raises(CaughtException):
+        execution.execute()
+    execution.refresh_from_db()
+    assert execution.status == ExecutionResult.ExecutionStatus.ERRORED
+    assert execution.error_json == {"type": "RuntimeError", "message": "bad x"}
+    assert "RuntimeError: bad x" in execution.traceback
+    [record] = [r for r in caplog.records if r.name == "turtle_shell.models"]
+    # handlers like AdminEmailHandler need the exception itself
+    assert isinstance(record.exc_info[1], RuntimeError)
+
+
+def test_execute_error_traceback_is_capped(db):
+    def leaf():
+        raise RuntimeError("deep")
+
+    def myfunc(a: int):
+        if a:
+            return myfunc(a - 1)
+        return leaf()
+
+    execution = create_execution(myfunc, a=TRACEBACK_LIMIT + 10)
+    with pytest.raises(CaughtException):
+        execution.execute()
+    # the frame that actually raised must survive the cap
+    assert ", in leaf\n" in execution.traceback
+    assert 'raise RuntimeError("deep")' in execution.traceback
+    assert execution.traceback.count('  File "') <= TRACEBACK_LIMIT
+
+
+def test_execute_refuses_finished_execution(db):
+    def myfunc(a: str):
+        return a
+
+    execution = create_execution(myfunc, a="x")
+    execution.execute()
+    with pytest.raises(ValueError, match="Cannot run"):
+        execution.execute()
+
+
+def test_list_entry():
+    execution = ExecutionResult(func_name="myfunc", input_json={})
+    assert execution.list_entry == [
+        execution.func_name,
+        execution.created,
+        execution.user,
+        execution.status,
+    ]
+
+
+def test_pydantic_object_cached_until_save(db, monkeypatch):
+    from turtle_shell import pydantic_adapter
+
+    calls = []
+    monkeypatch.setattr(
+        pydantic_adapter, "get_pydantic_object", lambda obj: calls.append(obj) or len(calls)
+    )
+    execution = ExecutionResult.objects.create(func_name="myfunc", input_json={})
+    assert execution.pydantic_object == 1
+    assert execution.pydantic_object == 1
+    execution.save()
+    assert execution.pydantic_object == 2
+    execution.refresh_from_db()
+    assert execution.pydantic_object == 3
@@ -1,6 +1,10 @@
 from turtle_shell import utils
+import datetime
+import decimal
 import enum
 import json
+import time
+import uuid
 import pytest
 
 
@@ -23,3 +27,21 @@ def test_json_encoder_registered():
     assert '"__enum__"' in s
     round_trip = json.loads(s, cls=utils.EnumAwareDecoder)
     assert round_trip == original
+
+
+def test_uuid7():
+    first = utils.uuid7()
+    time.sleep(0.002)
+    second = utils.uuid7()
+    assert first.version == second.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second
+    assert abs((first.int >> 80) - time.time_ns() // 1_000_000) < 1000
+
+
+def test_json_encoder_falls_back_to_django():
+    s = json.dumps(
+        {"when": datetime.date(2021, 4, 13), "amount": decimal.Decimal("1.50")},
+        cls=utils.EnumAwareEncoder,
+    )
+    assert json.loads(s) == {"when": "2021-04-13", "amount": "1.50"}
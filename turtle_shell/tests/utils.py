@@ -59,10 +59,24 @@ def compare_forms(actual: Type[forms.Form], expected: Type[forms.Form]):
         raise AssertionError(f"Forms have different docstrings: {e}") from e
 
 
-def execute_gql(func, gql):
+def register_only(func):
+    """Reset the global registry so it holds just func"""
     registry = turtle_shell.get_registry()
     registry.clear()
     registry.add(func)
+    return registry
+
+
+def create_execution(func, **input_json):
+    """Register only func and create a saved execution of it with the given input"""
+    from turtle_shell.models import ExecutionResult
+
+    register_only(func)
+    return ExecutionResult.objects.create(func_name=func.__name__, input_json=input_json)
+
+
+def execute_gql(func, gql):
+    registry = register_only(func)
     result = registry.schema.execute(gql)
     return result
 
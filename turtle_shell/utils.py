@@ -1,9 +1,25 @@
 import json
 import enum
+import os
+import time
+import uuid
 from collections import defaultdict
 from django.core.serializers.json import DjangoJSONEncoder
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered (RFC 9562 version 7) UUID.
+
+    48 bits of unix time in ms followed by random bits, so newly created rows land next to each
+    other at the end of the primary key index instead of all over it (like uuid4)."""
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    # set version (7) and variant (0b10) bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
 class EnumRegistry:
     # URP - global! :(
     _registered_enums = defaultdict(dict)
@@ -59,8 +75,7 @@ class EnumAwareEncoder(DjangoJSONEncoder):
     def default(self, o, **k):
         if isinstance(o, enum.Enum):
             return EnumRegistry.to_json_repr(o)
-        else:
-            super().default(o, **k)
+        return super().default(o, **k)
 
 
 class EnumAwareDecoder(json.JSONDecoder):
@@ -41,7 +41,12 @@ class ExecutionDetailView(ExecutionViewMixin, DetailView):
 class ExecutionListView(ExecutionViewMixin, ListView):
     def get_queryset(self):
         qs = super().get_queryset()
-        return qs.order_by("-created")
+        # user is rendered on every row of the list; the payload columns never are
+        return (
+            qs.select_related("user")
+            .defer("input_json", "output_json", "error_json", "compressed_traceback")
+            .order_by("-created")
+        )
 
 
 class ExecutionCreateView(ExecutionViewMixin, CreateView):